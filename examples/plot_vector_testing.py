@@ -13,9 +13,12 @@ vector data created using GeoPandas.
 # To begin, import the libraries that you need.
 
 import matplotlib.pyplot as plt
+import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.lines import Line2D
 import numpy as np
-import pandas as pd
-from shapely.geometry import Polygon, LineString
+import shapely
+from shapely.geometry import LineString, MultiLineString
 import geopandas as gpd
 from matplotcheck.vector import VectorTester
 
@@ -28,68 +31,124 @@ from matplotcheck.vector import VectorTester
 # while the lines could be roads and streams near those study areas. The points
 # could be measurements within the study areas.
 
+# Store the polygon vertices in one array, with ring offsets marking where
+# each ring starts and ends, and polygon offsets marking which rings belong to
+# each polygon. Keeping coordinates in plain arrays lets you plot them
+# directly, without going through shapely geometry objects.
+coords = np.array(
+    [(2, 4), (2, 4.25), (4.25, 4.25), (4.25, 2), (2, 2)], dtype=np.float64
+)
+poly_coords = np.concatenate([coords, coords + np.array([5, 7])])
+ring_offsets = np.array([0, 5, 10], dtype=np.int32)
+# Each polygon has a single exterior ring and no holes
+polygon_offsets = np.array([0, 1, 2], dtype=np.int32)
+
 # Create a polygon GeoDataFrame
-coords = [(2, 4), (2, 4.25), (4.25, 4.25), (4.25, 2), (2, 2)]
-coords_b = [(i[0]+5, i[1]+7) for i in coords]
 polygon_gdf = gpd.GeoDataFrame(
-    [1, 2], geometry=[Polygon(coords), Polygon(coords_b)], crs="epsg:4326")
-polygon_gdf["attr"] = ["Area 1", "Area 2"]
+    {"id": [1, 2], "attr": ["Area 1", "Area 2"]},
+    geometry=shapely.from_ragged_array(
+        shapely.GeometryType.POLYGON,
+        poly_coords,
+        (ring_offsets, polygon_offsets),
+    ),
+    crs="epsg:4326",
+)
+
+# Store the vertices of each line in its own array, along with its attribute
+line_coords = [
+    np.array([(1, 1), (2, 2), (3, 2), (5, 3)], dtype=np.float64),
+    np.array([(3, 4), (5, 7), (12, 2), (10, 5), (9, 7.5)], dtype=np.float64),
+    np.array([(2, 1), (3, 1), (4, 1), (5, 2)], dtype=np.float64),
+]
+line_attrs = ["road", "road", "stream"]
 
 # Create a line GeoDataFrame
-linea = LineString([(1, 1), (2, 2), (3, 2), (5, 3)])
-lineb = LineString([(3, 4), (5, 7), (12, 2), (10, 5), (9, 7.5)])
+linea, lineb, linec = [LineString(line) for line in line_coords]
 line_gdf = gpd.GeoDataFrame([1, 2], geometry=[linea, lineb], crs="epsg:4326")
 
 # Create a multiline GeoDataFrame
-linec = LineString([(2, 1), (3, 1), (4, 1), (5, 2)])
-multi_line_gdf = gpd.GeoDataFrame(geometry=gpd.GeoSeries(
-    [line_gdf.unary_union, linec]), crs="epsg:4326")
-multi_line_gdf["attr"] = ["road", "stream"]
-
-# Create a point GeoDataFrame
-points = pd.DataFrame(
-    {
-        "lat": np.array([1, 2, 1, 0, 4]),
-        "lon": np.array([3, 4, 0, 0, 1]),
-    }
+multi_line_gdf = gpd.GeoDataFrame(
+    {"attr": ["road", "stream"]},
+    geometry=[MultiLineString(list(line_gdf.geometry)), linec],
+    crs="epsg:4326",
 )
 
+# Create a point GeoDataFrame
+lat = np.array([1, 2, 1, 0, 4])
+lon = np.array([3, 4, 0, 0, 1])
+point_sizes = np.array([100, 100, 300, 300, 500])
 point_gdf = gpd.GeoDataFrame(
-    {"A": np.arange(5), "B": np.arange(5)},
-    geometry=gpd.points_from_xy(points.lon, points.lat), crs="epsg:4326"
+    {"A": np.arange(5), "B": np.arange(5), "size": point_sizes},
+    geometry=shapely.points(lon, lat),
+    crs="epsg:4326",
 )
-point_gdf["size"] = [100, 100, 300, 300, 500]
 
 # Create symbology dictionary to use in the legend
 line_symb = {"road": "black", "stream": "blue"}
 point_symb = {100: "purple", 300: "green", 500: "brown"}
 
+# Look up the color of each line and point from the symbology dictionaries
+line_colors = [line_symb[attr] for attr in line_attrs]
+point_colors = [point_symb[size] for size in point_sizes]
+
 ################################################################################
 # Create Your Spatial Plot
 # ------------------------
 # Above you created several GeoPandas GeoDataFrame objects that you want
-# to plot. To plot these data according to attribute value, you can group
-# the geometry by attributes and plot within a loop. Once you have created your
-# plot, you will be ready to test it using Matplotcheck.
-
-# Plot your data
-fig, ax = plt.subplots()
-polygon_gdf.plot(ax=ax, color="purple")
-
-# Plot your line data by attributes using groupby
-for ctype, lines in multi_line_gdf.groupby('attr'):
-    color = line_symb[ctype]
-    label = ctype
-    lines.plot(color=color, ax=ax, label=label)
-
-# Plot your points data by size using groupby
-for ctype, points in point_gdf.groupby('size'):
-    color = point_symb[ctype]
-    label = ctype
-    points.plot(color=color, ax=ax, label=label, markersize=ctype)
-
-# Add a legend
-ax.legend(title="Legend", loc=(1.1, .1));
+# to plot. To plot these data according to attribute value, you can draw each
+# geometry type as a single matplotlib collection, with colors and sizes looked
+# up from the symbology dictionaries. One collection per geometry type is much
+# faster to draw than one plot call per attribute group. Once you have created
+# your plot, you will be ready to test it using Matplotcheck.
+
+
+# Plot your data. The plotting code is wrapped in a function so that the same
+# plot can be drawn again later on.
+def plot_spatial_data():
+    """Plot the polygons, lines and points on one set of axes."""
+    fig, ax = plt.subplots()
+
+    # Plot all of your polygons as a single PatchCollection, drawing the
+    # exterior ring of each polygon, which is its first ring
+    rings = np.split(poly_coords, ring_offsets[1:-1])
+    polygon_patches = [
+        mpatches.Polygon(rings[i], closed=True) for i in polygon_offsets[:-1]
+    ]
+    ax.add_collection(
+        PatchCollection(
+            polygon_patches, facecolors=["purple"] * len(polygon_patches)
+        )
+    )
+
+    # Plot all of your lines as a single LineCollection colored by attribute
+    ax.add_collection(LineCollection(line_coords, colors=line_colors))
+
+    # Plot all of your points with one scatter call, colored and sized by
+    # size
+    ax.scatter(lon, lat, s=point_sizes, c=point_colors)
+    ax.autoscale_view()
+
+    # Add a legend, using proxy artists since the collections carry no labels
+    legend_handles = [
+        Line2D([0], [0], color=color, label=attr)
+        for attr, color in line_symb.items()
+    ] + [
+        Line2D(
+            [0],
+            [0],
+            marker="o",
+            color="w",
+            markerfacecolor=color,
+            markersize=np.sqrt(size),
+            label=size,
+        )
+        for size, color in point_symb.items()
+    ]
+    ax.legend(handles=legend_handles, title="Legend", loc=(1.1, 0.1))
+    return fig, ax
+
+
+fig, ax = plot_spatial_data()
 
 ################################################################################
 # Create A Matplotcheck VectorTester Object
@@ -175,24 +234,8 @@ vector_test.assert_polygons(polygon_gdf)
 # First, import the Notebook module from Matplotcheck
 import matplotcheck.notebook as nb
 
-# Plot your data
-fig, ax = plt.subplots()
-polygon_gdf.plot(ax=ax, color="purple")
-
-# Plot your line data by attributes using groupby
-for ctype, lines in multi_line_gdf.groupby('attr'):
-    color = line_symb[ctype]
-    label = ctype
-    lines.plot(color=color, ax=ax, label=label)
-
-# Plot your points data by size using groupby
-for ctype, points in point_gdf.groupby('size'):
-    color = point_symb[ctype]
-    label = ctype
-    points.plot(color=color, ax=ax, label=label, markersize=ctype)
-
-# Add a legend
-ax.legend(title="Legend", loc=(1.1, .1));
+# Plot your data, using the same plotting function as above
+fig, ax = plot_spatial_data()
 
 # Here is where you access the axes objects of the plot for testing.
 # You can add the code line below to the end of any plot cell to store all axes
@@ -1,21 +1,36 @@
 """Pytest fixtures for matplotcheck tests"""
 import pytest
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 import pandas as pd
 import geopandas as gpd
 from shapely.geometry import Polygon, LineString
 from matplotcheck.base import PlotTester
 
+# Use a non-interactive backend so that no test can block on a GUI window
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
 
-@pytest.fixture
-def pd_df():
+
+# pd_df_template and the session-scoped plots built from it (pt_scatter_plt,
+# pt_bar_plt) are shared by every test and must not be modified. Tests that
+# need to change the data use the per-test copy from pd_df instead.
+
+
+@pytest.fixture(scope="session")
+def pd_df_template():
     """Create a pandas dataframe for testing"""
     return pd.DataFrame(
         {"A": np.arange(100), "B": np.random.randint(0, 100, size=100)}
     )
 
 
+@pytest.fixture
+def pd_df(pd_df_template):
+    """Create a copy of the test dataframe for a single test"""
+    return pd_df_template.copy()
+
+
 @pytest.fixture
 def pd_df_timeseries():
     """Create a pandas dataframe for testing, with timeseries in one column"""
@@ -84,17 +99,18 @@ def pd_xlabels():
     return df
 
 
-@pytest.fixture
-def pt_scatter_plt(pd_df):
+@pytest.fixture(scope="session")
+def pt_scatter_plt(pd_df_template):
     """Create scatter plot for testing"""
     fig, ax = plt.subplots()
 
-    pd_df.plot("A", "B", kind="scatter", ax=ax)
+    pd_df_template.plot("A", "B", kind="scatter", ax=ax)
     ax.set_title("My Plot Title", fontsize=30)
     ax.set_xlabel("x label")
     ax.set_ylabel("y label")
 
-    return PlotTester(ax)
+    yield PlotTester(ax)
+    plt.close(fig)
 
 
 @pytest.fixture
@@ -131,17 +147,18 @@ def pt_multi_line_plt(pd_df):
     return PlotTester(ax)
 
 
-@pytest.fixture
-def pt_bar_plt(pd_df):
+@pytest.fixture(scope="session")
+def pt_bar_plt(pd_df_template):
     """Create bar plot for testing"""
     fig, ax = plt.subplots()
 
-    pd_df.plot("A", "B", kind="bar", ax=ax)
+    pd_df_template.plot("A", "B", kind="bar", ax=ax)
     ax.set_title("My Plot Title", fontsize=30)
     ax.set_xlabel("x label")
     ax.set_ylabel("y label")
 
-    return PlotTester(ax)
+    yield PlotTester(ax)
+    plt.close(fig)
 
 
 @pytest.fixture
@@ -24,7 +24,6 @@ def test_scatter_plot(pt_scatter_plt):
         pt_scatter_plt.assert_plot_type("bar")
     with pytest.raises(AssertionError, match="Plot is not of type line"):
         pt_scatter_plt.assert_plot_type("line")
-    plt.close()
 
 
 def test_bar_plot(pt_bar_plt):
@@ -36,7 +35,6 @@ def test_bar_plot(pt_bar_plt):
         pt_bar_plt.assert_plot_type("scatter")
     with pytest.raises(AssertionError, match="Plot is not of type line"):
         pt_bar_plt.assert_plot_type("line")
-    plt.close()
 
 
 def test_options(pt_line_plt):
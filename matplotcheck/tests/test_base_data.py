@@ -8,9 +8,24 @@ import pandas as pd
 
 """Fixtures"""
 
+# The *_template dataframes and the PlotTester fixtures plotted from them are
+# shared by every test in this module and must not be modified. Tests that
+# need to change the data use the per-test copies instead.
 
-@pytest.fixture
-def pd_df_monthly_data():
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close the figures created by each test once it has finished. Figures
+    from module and session scoped fixtures are left open for their own
+    teardown."""
+    figures_before = set(plt.get_fignums())
+    yield
+    for num in set(plt.get_fignums()) - figures_before:
+        plt.close(num)
+
+
+@pytest.fixture(scope="module")
+def pd_df_monthly_data_template():
     """Create a pandas dataframe with monthy data"""
     monthly_data = {
         "months": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul"],
@@ -20,17 +35,23 @@ def pd_df_monthly_data():
 
 
 @pytest.fixture
-def pt_monthly_data(pd_df_monthly_data):
+def pd_df_monthly_data(pd_df_monthly_data_template):
+    """Create a copy of the monthly data for a single test"""
+    return pd_df_monthly_data_template.copy()
+
+
+@pytest.fixture(scope="module")
+def pt_monthly_data(pd_df_monthly_data_template):
     """Create a PlotTester object from a bar plot with monthly data"""
     fig, ax = plt.subplots()
 
-    pd_df_monthly_data.plot("months", "data", kind="bar", ax=ax)
-    axis = plt.gca()
-    return PlotTester(axis)
+    pd_df_monthly_data_template.plot("months", "data", kind="bar", ax=ax)
+    yield PlotTester(ax)
+    plt.close(fig)
 
 
-@pytest.fixture
-def pd_df_monthly_data_numeric():
+@pytest.fixture(scope="module")
+def pd_df_monthly_data_numeric_template():
     """Create a pandas dataframe with monthly data and numeric month labels"""
     monthly_data = {
         "months": [1, 2, 3, 4, 5, 6, 7],
@@ -40,14 +61,22 @@ def pd_df_monthly_data_numeric():
 
 
 @pytest.fixture
-def pt_monthly_data_numeric(pd_df_monthly_data_numeric):
+def pd_df_monthly_data_numeric(pd_df_monthly_data_numeric_template):
+    """Create a copy of the numeric monthly data for a single test"""
+    return pd_df_monthly_data_numeric_template.copy()
+
+
+@pytest.fixture(scope="module")
+def pt_monthly_data_numeric(pd_df_monthly_data_numeric_template):
     """Create a PlotTester object from a bar plot with monthly data and numeric
     month labels"""
     fig, ax = plt.subplots()
 
-    pd_df_monthly_data_numeric.plot("months", "data", kind="bar", ax=ax)
-    axis = plt.gca()
-    return PlotTester(axis)
+    pd_df_monthly_data_numeric_template.plot(
+        "months", "data", kind="bar", ax=ax
+    )
+    yield PlotTester(ax)
+    plt.close(fig)
 
 
 @pytest.fixture
@@ -84,58 +113,53 @@ def pt_hist_overlapping():
 def test_assert_xydata_scatter(pt_scatter_plt, pd_df):
     """Checks points in scatter plot against expected data"""
     pt_scatter_plt.assert_xydata(pd_df, xcol="A", ycol="B")
-    plt.close()
 
 
 def test_assert_xydata_tolerance(pt_scatter_plt, pd_df):
     """Checks that slightly altered data still passes with an appropriate
     tolerence"""
-    pd_df = pd_df.astype(np.float)
-    for i in range(len(pd_df["A"])):
-        pd_df["A"][i] = pd_df["A"][i] + np.random.choice([-0.1, 0.1])
-        pd_df["B"][i] = pd_df["B"][i] + np.random.choice([-0.1, 0.1])
+    pd_df = pd_df.astype(float)
+    pd_df["A"] = pd_df["A"].to_numpy() + np.random.choice(
+        [-0.1, 0.1], size=len(pd_df)
+    )
+    pd_df["B"] = pd_df["B"].to_numpy() + np.random.choice(
+        [-0.1, 0.1], size=len(pd_df)
+    )
     pt_scatter_plt.assert_xydata(pd_df, xcol="A", ycol="B", tolerance=0.2)
-    plt.close()
 
 
 def test_assert_xydata_abs_tolerance_fails(pt_scatter_plt, pd_df):
     """Checks that data altered beyond the tolerence correctly fails."""
-    pd_df["A"][1] = pd_df["A"][1] + 1
+    pd_df.loc[1, "A"] += 1
     with pytest.raises(AssertionError, match="Incorrect data values"):
         pt_scatter_plt.assert_xydata(pd_df, xcol="A", ycol="B", tolerance=0.1)
-    plt.close()
 
 
 def test_assert_xydata_changed_data(pt_scatter_plt, pd_df):
     """assert_xydata should fail when we change the data"""
-    pd_df["B"][1] += 5
+    pd_df.loc[1, "B"] += 5
     with pytest.raises(AssertionError, match="Incorrect data values"):
         pt_scatter_plt.assert_xydata(pd_df, xcol="A", ycol="B")
-    plt.close()
 
 
 def test_assert_xydata_scatter_points_only(pt_scatter_plt, pd_df):
     """Checks points in scatter plot against expected data"""
     pt_scatter_plt.assert_xydata(pd_df, xcol="A", ycol="B", points_only=True)
-    plt.close()
 
 
 def test_assert_xydata_changed_data_points_only(pt_scatter_plt, pd_df):
     """assert_xydata should fail when we change the data"""
-    pd_df["B"][1] += 5
+    pd_df.loc[1, "B"] += 5
     with pytest.raises(AssertionError, match="Incorrect data values"):
         pt_scatter_plt.assert_xydata(
             pd_df, xcol="A", ycol="B", points_only=True
         )
-    plt.close()
 
 
 def test_assert_xydata_floatingpoint_error(pt_scatter_plt, pd_df):
     """Tests the assert_xydata correctly handles floating point error"""
-    for i in range(len(pd_df["A"])):
-        pd_df["A"][i] = pd_df["A"][i] + 1.0e-10
+    pd_df["A"] = pd_df["A"] + np.spacing(pd_df["A"].to_numpy(dtype=float))
     pt_scatter_plt.assert_xydata(pd_df, xcol="A", ycol="B", points_only=True)
-    plt.close()
 
 
 """ LABELS DATA TESTS """
@@ -145,7 +169,6 @@ def test_assert_xydata_xlabel(pt_bar_plt, pd_df):
     """Tests the xlabels flag on xydata"""
     pd_df["A"] = pd_df["A"].apply(str)
     pt_bar_plt.assert_xydata(pd_df, xcol="A", ycol="B", xlabels=True)
-    plt.close()
 
 
 def test_assert_xydata_xlabel_fails(pt_bar_plt, pd_df):
@@ -154,7 +177,6 @@ def test_assert_xydata_xlabel_fails(pt_bar_plt, pd_df):
     pd_df.iloc[1, 0] = "this ain't it cheif"
     with pytest.raises(AssertionError, match="Incorrect data values"):
         pt_bar_plt.assert_xydata(pd_df, xcol="A", ycol="B", xlabels=True)
-    plt.close()
 
 
 def test_assert_xydata_xlabel_text(pd_df_monthly_data, pt_monthly_data):
@@ -163,7 +185,6 @@ def test_assert_xydata_xlabel_text(pd_df_monthly_data, pt_monthly_data):
     pt_monthly_data.assert_xydata(
         pd_df_monthly_data, xcol="months", ycol="data", xlabels=True
     )
-    plt.close()
 
 
 def test_assert_xydata_xlabel_text_fails(pd_df_monthly_data, pt_monthly_data):
@@ -178,8 +199,6 @@ def test_assert_xydata_xlabel_text_fails(pd_df_monthly_data, pt_monthly_data):
             pd_df_expected_data, xcol="months", ycol="data", xlabels=True
         )
 
-    plt.close()
-
 
 def test_assert_xydata_xlabel_numeric(
     pd_df_monthly_data_numeric, pt_monthly_data_numeric
@@ -190,39 +209,22 @@ def test_assert_xydata_xlabel_numeric(
     pt_monthly_data_numeric.assert_xydata(
         pd_df_monthly_data_numeric, xcol="months", ycol="data", xlabels=True
     )
-    plt.close()
 
 
+@pytest.mark.parametrize("bad_column", ["months", "data"])
 def test_assert_xydata_xlabel_numeric_fails(
-    pd_df_monthly_data_numeric, pt_monthly_data_numeric
+    pd_df_monthly_data_numeric, pt_monthly_data_numeric, bad_column
 ):
-    """Tests the xlabels flag on xydata correctly fails with numeric expected
-    x-labels."""
+    """Tests the xlabels flag on xydata correctly fails with wrong numeric
+    expected x-labels or y-data."""
 
     pd_df_expected_data = pd_df_monthly_data_numeric
-    pd_df_expected_data.loc[6, "months"] = 99999
+    pd_df_expected_data.loc[6, bad_column] = 99999
 
     with pytest.raises(AssertionError, match="Incorrect data values"):
         pt_monthly_data_numeric.assert_xydata(
             pd_df_expected_data, xcol="months", ycol="data", xlabels=True
         )
-    plt.close()
-
-
-def test_assert_xydata_xlabel_numeric_fails_bad_y(
-    pd_df_monthly_data_numeric, pt_monthly_data_numeric
-):
-    """Tests that the xlabels flag on xydata correctly fails with wrong numeric
-    y-data"""
-
-    pd_df_expected_data = pd_df_monthly_data_numeric
-    pd_df_expected_data.loc[6, "data"] = 99999
-
-    with pytest.raises(AssertionError, match="Incorrect data values"):
-        pt_monthly_data_numeric.assert_xydata(
-            pd_df_expected_data, xcol="months", ycol="data", xlabels=True
-        )
-    plt.close()
 
 
 def test_assert_xydata_xlabel_numeric_expected_string_actual(
@@ -249,13 +251,11 @@ def test_assert_xydata_xlabel_numeric_expected_string_actual(
             ycol="data",
             xlabels=True,
         )
-    plt.close()
 
 
 def test_assert_xydata_expected_none(pt_scatter_plt):
     """Tests that assert_xydata passes when xy_expected is None"""
     pt_scatter_plt.assert_xydata(None)
-    plt.close()
 
 
 """Histogram Tests"""
@@ -265,8 +265,6 @@ def test_assert_num_bins(pt_hist):
     """Tests that assert_num_bins() correctly passes"""
     pt_hist.assert_num_bins(6)
 
-    plt.close()
-
 
 def test_assert_num_bins_incorrect(pt_hist):
     """Tests that assert_num_bins() correctly fails"""
@@ -275,16 +273,12 @@ def test_assert_num_bins_incorrect(pt_hist):
     ):
         pt_hist.assert_num_bins(5)
 
-    plt.close()
-
 
 def test_assert_num_bins_double_histogram(pt_hist_overlapping):
     """Tests that assert_num_bins correctly passes with overlapping
     histograms"""
     pt_hist_overlapping.assert_num_bins(6)
 
-    plt.close()
-
 
 def test_assert_num_bins_double_histogram_incorrect(pt_hist_overlapping):
     """Tests that assert_num_bins() correctly fails with overlapping
@@ -294,16 +288,12 @@ def test_assert_num_bins_double_histogram_incorrect(pt_hist_overlapping):
     ):
         pt_hist_overlapping.assert_num_bins(5)
 
-    plt.close()
-
 
 def test_get_bin_values(pt_hist):
     """Tests that get_bin_values() returns the correct bin valuess."""
     bin_values = pt_hist.get_bin_values()
     assert bin_values == [10.0, 29.0, 22.0, 19.0, 15.0, 5.0]
 
-    plt.close()
-
 
 def test_get_bin_values_overlapping(pt_hist_overlapping):
     """Tests that get_bin_values returns the correct bin values with
@@ -324,8 +314,6 @@ def test_get_bin_values_overlapping(pt_hist_overlapping):
         14.0,
     ]
 
-    plt.close()
-
 
 def test_assert_bin_values(pt_hist_overlapping):
     """Tests that assert_bin_values() correctly passes with overlapping
@@ -334,8 +322,6 @@ def test_assert_bin_values(pt_hist_overlapping):
 
     pt_hist_overlapping.assert_bin_values(bin_values)
 
-    plt.close()
-
 
 def test_assert_bin_values_incorrect(pt_hist_overlapping):
     """Tests that assert_bin_values() correctly fails with overlapping
@@ -348,8 +334,6 @@ def test_assert_bin_values_incorrect(pt_hist_overlapping):
     ):
         pt_hist_overlapping.assert_bin_values(bin_values)
 
-    plt.close()
-
 
 def test_assert_bin_values_tolerance(pt_hist_overlapping):
     """Test that assert_bin_values correctly passes when using tolerance."""
@@ -359,8 +343,6 @@ def test_assert_bin_values_tolerance(pt_hist_overlapping):
 
     pt_hist_overlapping.assert_bin_values(bin_values, tolerance=2)
 
-    plt.close()
-
 
 def test_assert_bin_values_tolerance_fails(pt_hist_overlapping):
     """Test that assert_bin_values correctly fails when using tolerance."""
@@ -373,16 +355,12 @@ def test_assert_bin_values_tolerance_fails(pt_hist_overlapping):
     ):
         pt_hist_overlapping.assert_bin_values(bin_values, tolerance=0.5)
 
-    plt.close()
-
 
 def test_assert_bin_midpoints_pass(pt_hist):
     """Test that bin midpoints are correct"""
     bins = [2.5, 3.5, 4.5, 5.5, 6.5, 7.5]
     pt_hist.assert_bin_midpoints(bins)
 
-    plt.close()
-
 
 def test_assert_bin_midpoints_fail(pt_hist):
     """Test that bin midpoints fail when incorrect"""
@@ -390,8 +368,6 @@ def test_assert_bin_midpoints_fail(pt_hist):
     with pytest.raises(AssertionError, match="Did not find expected bin midp"):
         pt_hist.assert_bin_midpoints(bins)
 
-    plt.close()
-
 
 def test_assert_bin_midpoints_fails_wrong_type(pt_hist):
     """Test that bin midpoints fails when not handed a list"""
@@ -399,8 +375,6 @@ def test_assert_bin_midpoints_fails_wrong_type(pt_hist):
     with pytest.raises(ValueError, match="Need to submit a list for expected"):
         pt_hist.assert_bin_midpoints(bins)
 
-    plt.close()
-
 
 def test_assert_bin_midpoints_fails_wrong_length(pt_hist):
     """Test that bin midpoints fails when not handed a list with the wrong
@@ -409,8 +383,6 @@ def test_assert_bin_midpoints_fails_wrong_length(pt_hist):
     with pytest.raises(ValueError, match="Bin midpoints lists lengths do no "):
         pt_hist.assert_bin_midpoints(bins)
 
-    plt.close()
-
 
 def test_assert_bin_midpoints_fail_custom_message(pt_hist):
     """Test that correct error message is thrown when bin midpoints fail"""
@@ -418,16 +390,12 @@ def test_assert_bin_midpoints_fail_custom_message(pt_hist):
     with pytest.raises(AssertionError, match="Test Message"):
         pt_hist.assert_bin_midpoints(bins, message="Test Message")
 
-    plt.close()
-
 
 def test_assert_bin_midpoints_overlap_pass(pt_hist_overlapping):
     """Test that bin midpoints are correct with overlapping histograms"""
     bins = [2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5]
     pt_hist_overlapping.assert_bin_midpoints(bins)
 
-    plt.close()
-
 
 def test_assert_bin_midpoints_overlap_fail(pt_hist_overlapping):
     """Test that bin midpoints fail with overlapping histograms when
@@ -438,8 +406,6 @@ def test_assert_bin_midpoints_overlap_fail(pt_hist_overlapping):
     ):
         pt_hist_overlapping.assert_bin_midpoints(bins)
 
-    plt.close()
-
 
 def test_assert_bin_midpoints_overlap_length_fail(pt_hist_overlapping):
     """Test that bin midpoints fail with overlapping histograms when
@@ -449,5 +415,3 @@ def test_assert_bin_midpoints_overlap_length_fail(pt_hist_overlapping):
         ValueError, match="Bin midpoints lists lengths do no match"
     ):
         pt_hist_overlapping.assert_bin_midpoints(bins)
-
-    plt.close()
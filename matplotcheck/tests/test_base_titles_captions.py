@@ -97,7 +97,6 @@ def test_title_contains_figure_nosuptitle(pt_bar_plt):
         pt_bar_plt.assert_title_contains(
             ["My", "Figure", "Title"], title_type="figure"
         )
-    plt.close()
 
 
 def test_title_contains_both_axes_figure(pt_line_plt):
@@ -168,4 +167,3 @@ def test_assert_caption_contains_nocaption(pt_bar_plt):
         AssertionError, match="No caption exists in appropriate location"
     ):
         pt_bar_plt.assert_caption_contains([["Figure"], ["Caption"]])
-    plt.close()